@@ -1,5 +1,6 @@
+import gzip
+import hashlib
 import io
-import json
 import logging
 import os
 import tempfile
@@ -10,18 +11,51 @@ from urllib.parse import urlparse
 
 import requests
 from flask import Flask, jsonify, request, send_file, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
+import orjson
+
 from config import Config
 from services.export_service import ExportService
 from services.document_parser import DocumentParser
 from services.llm_engine import LLMEngine
 from integrations.registry import get_issue_provider, get_publisher
+from utils.json_store import load_json, save_json
+
+
+# jsonify()/request.get_json() backed by orjson. Pretty-printed debug output and anything
+# orjson rejects (e.g. ints wider than 64 bits) go through the stdlib provider unchanged.
+class OrjsonJSONProvider(DefaultJSONProvider):
+    # Datetimes are passed to default() so they keep Flask's HTTP-date format.
+    _dump_options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(obj)
+        try:
+            body = orjson.dumps(
+                obj,
+                default=self.default,
+                option=self._dump_options | orjson.OPT_APPEND_NEWLINE,
+            )
+        except orjson.JSONEncodeError:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
 
 
 app = Flask(__name__)
+app.json = OrjsonJSONProvider(app)
 app.config["SECRET_KEY"] = Config.SECRET_KEY
+# Oversized uploads are refused from the Content-Length header instead of being spooled first.
+app.config["MAX_CONTENT_LENGTH"] = Config.MAX_UPLOAD_REQUEST_BYTES or None
 CORS(app, origins=[origin.strip() for origin in Config.CORS_ORIGINS.split(",") if origin.strip()])
 
 logging.basicConfig(
@@ -37,7 +71,11 @@ llm_engine = LLMEngine()
 export_service = ExportService(export_dir=Config.EXPORT_DIR)
 testrail_publisher = get_publisher()
 document_parser = DocumentParser()
-_frontend_dist = os.path.join(os.path.dirname(__file__), "..", "frontend", "dist")
+_frontend_dist = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "frontend", "dist"))
+_frontend_index_path = os.path.join(_frontend_dist, "index.html")
+_frontend_index_cache = {"mtime_ns": None, "body": b"", "etag": ""}
+_frontend_index_lock = Lock()
+_frontend_asset_max_age = 365 * 24 * 60 * 60
 
 _latest_cases = []
 _latest_lock = Lock()
@@ -45,28 +83,11 @@ _activity_log = []
 _activity_lock = Lock()
 _settings_lock = Lock()
 _manual_upload_max_size_bytes = 10 * 1024 * 1024
-_manual_upload_exts = {
-    ".pdf",
-    ".docx",
-    ".txt",
-    ".md",
-    ".log",
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".gif",
-    ".xml",
-    ".json",
-    ".yaml",
-    ".yml",
-    ".html",
-    ".htm",
-    ".rtf",
-    ".csv",
-    ".xlsx",
-    ".xls",
-    ".oc",
-} 
+_gzip_min_size_bytes = 1024
+# Only responses built in memory are compressed; send_file/send_from_directory pass through.
+_gzip_mimetypes = {"application/json", "text/html"}
+_manual_image_exts = {".png", ".jpg", ".jpeg", ".gif"}
+_manual_upload_exts = set(DocumentParser.SUPPORTED_EXTENSIONS) | _manual_image_exts | {".oc"}
 _testrail_repository_modes = {
     "single_repository",
     "single_repository_with_baseline",
@@ -220,10 +241,10 @@ def _read_cases_by_status(status: str) -> list:
 def _load_persisted_state():
     with _latest_lock:
         _latest_cases.clear()
-        _latest_cases.extend(_load_json(_latest_cases_file, []))
+        _latest_cases.extend(load_json(_latest_cases_file, []))
     with _activity_lock:
         _activity_log.clear()
-        _activity_log.extend(_load_json(_activity_log_file, []))
+        _activity_log.extend(load_json(_activity_log_file, []))
     settings = _load_settings()
     _apply_runtime_settings(settings)
 
@@ -293,42 +314,16 @@ def _log_activity(message, category="system"):
     _persist_activity_log()
 
 
-def _ensure_storage_dir():
-    if not os.path.isdir(_storage_dir):
-        os.makedirs(_storage_dir, exist_ok=True)
-
-
-def _load_json(path, fallback):
-    try:
-        if not os.path.isfile(path):
-            return fallback
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (OSError, json.JSONDecodeError):
-        return fallback
-
-
-def _save_json(path, payload):
-    try:
-        _ensure_storage_dir()
-        temp_path = f"{path}.tmp"
-        with open(temp_path, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=True, indent=2)
-        os.replace(temp_path, path)
-    except OSError:
-        logger.warning("Failed to persist data to %s", path)
-
-
 def _persist_latest_cases():
     with _latest_lock:
         snapshot = list(_latest_cases)
-    _save_json(_latest_cases_file, snapshot)
+    save_json(_latest_cases_file, snapshot)
 
 
 def _persist_activity_log():
     with _activity_lock:
         snapshot = list(_activity_log)
-    _save_json(_activity_log_file, snapshot)
+    save_json(_activity_log_file, snapshot)
 
 
 def _log_rejection(test_case_id, reason):
@@ -357,7 +352,7 @@ def _load_settings():
     with _settings_lock:
         if _settings_cache:
             return dict(_settings_cache)
-        stored = _load_json(_settings_file, {})
+        stored = load_json(_settings_file, {})
         merged = _deep_merge(_default_settings, stored)
         _settings_cache.update(merged)
         return dict(_settings_cache)
@@ -368,12 +363,12 @@ def _save_settings(updates):
         if _settings_cache:
             base = dict(_settings_cache)
         else:
-            stored = _load_json(_settings_file, {})
+            stored = load_json(_settings_file, {})
             base = _deep_merge(_default_settings, stored)
         merged = _deep_merge(base, updates or {})
         _settings_cache.clear()
         _settings_cache.update(merged)
-        _save_json(_settings_file, merged)
+        save_json(_settings_file, merged)
         return dict(_settings_cache)
 
 
@@ -414,12 +409,50 @@ def _apply_runtime_settings(settings):
     )
 
 
+def _frontend_index_response():
+    # index.html is served for "/" and every SPA route; keep it in memory until a rebuild changes it.
+    try:
+        mtime_ns = os.stat(_frontend_index_path).st_mtime_ns
+    except OSError:
+        return None
+    with _frontend_index_lock:
+        if _frontend_index_cache["mtime_ns"] != mtime_ns:
+            with open(_frontend_index_path, "rb") as fp:
+                body = fp.read()
+            _frontend_index_cache.update(
+                mtime_ns=mtime_ns,
+                body=body,
+                etag=hashlib.sha256(body).hexdigest(),
+            )
+        body = _frontend_index_cache["body"]
+        etag = _frontend_index_cache["etag"]
+
+    response = app.response_class(body, mimetype="text/html")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+
+def _conditional_json(payload):
+    # Polled views get a 304 while the queue is unchanged; gzip and the client skip the body.
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
 def _extract_payload():
     if request.is_json:
         return request.get_json(silent=True) or {}
     return request.form.to_dict(flat=True)
 
 
+def _bypass_llm_cache(payload):
+    raw = payload.get("no_cache", request.args.get("no_cache", ""))
+    if isinstance(raw, bool):
+        return raw
+    return str(raw).strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _extract_test_types(payload):
     raw = payload.get("test_types", [])
     if isinstance(raw, list):
@@ -472,95 +505,89 @@ def _apply_include_fields(issue_data, include_fields):
     return filtered
 
 
-def _parse_manual_attachments(uploaded_files):
-    parsed_chunks = []
-    attachment_records = []
-
-    for file_storage in uploaded_files:
-        if not file_storage:
-            continue
-
-        filename = str(file_storage.filename or "").strip() or "attachment"
-        extension = os.path.splitext(filename)[1].lower()
-        mime_type = str(file_storage.mimetype or "application/octet-stream").strip()
-
-        if extension not in _manual_upload_exts:
-            attachment_records.append(
-                {
-                    "source_issue_key": "MANUAL",
-                    "filename": filename,
-                    "mime_type": mime_type,
-                    "size_bytes": 0,
-                    "content_url": "",
-                    "download_status": "uploaded_by_user",
-                    "parse_status": "unsupported_type",
-                    "parsed_text": "",
-                }
-            )
-            continue
-
-        file_storage.stream.seek(0, os.SEEK_END)
-        size_bytes = int(file_storage.stream.tell() or 0)
-        file_storage.stream.seek(0)
-
-        if size_bytes > _manual_upload_max_size_bytes:
-            attachment_records.append(
-                {
-                    "source_issue_key": "MANUAL",
-                    "filename": filename,
-                    "mime_type": mime_type,
-                    "size_bytes": size_bytes,
-                    "content_url": "",
-                    "download_status": "uploaded_by_user",
-                    "parse_status": "file_too_large",
-                    "parsed_text": "",
-                }
-            )
-            continue
+def _upload_digest(stream):
+    hasher = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+        hasher.update(chunk)
+    stream.seek(0)
+    return hasher.hexdigest()
 
-        parsed_text = ""
-        parse_status = "empty_or_unsupported"
 
-        if extension in {".png", ".jpg", ".jpeg", ".gif"}:
-            parsed_text = (
-                f"Image attachment provided: {filename}. "
-                "Use this image as input for visual/UI related test scenarios."
-            )
-            parse_status = "metadata_only"
-        else:
-            temp_path = ""
-            try:
-                with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as tmp_file:
-                    temp_path = tmp_file.name
-                    file_storage.save(tmp_file)
-                parsed_text = document_parser.parse_file(temp_path)
-                parse_status = "parsed" if parsed_text else "empty_or_unsupported"
-            except Exception:
-                parsed_text = ""
-                parse_status = "parse_failed"
-            finally:
-                if temp_path and os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except OSError:
-                        logger.warning("Failed to remove temp file: %s", temp_path)
-
-        attachment_records.append(
-            {
+def _parse_manual_attachments(uploaded_files):
+    parsed_chunks = []
+    # (record, digest, is_duplicate) per upload; digest is set only for files sent to the parser.
+    entries = []
+    temp_paths_by_digest = {}
+
+    with tempfile.TemporaryDirectory(prefix="phoenix_") as temp_dir:
+        for file_storage in uploaded_files:
+            if not file_storage:
+                continue
+
+            filename = str(file_storage.filename or "").strip() or "attachment"
+            extension = os.path.splitext(filename)[1].lower()
+            mime_type = str(file_storage.mimetype or "application/octet-stream").strip()
+            record = {
                 "source_issue_key": "MANUAL",
                 "filename": filename,
                 "mime_type": mime_type,
-                "size_bytes": size_bytes,
+                "size_bytes": 0,
                 "content_url": "",
                 "download_status": "uploaded_by_user",
-                "parse_status": parse_status,
-                "parsed_text": parsed_text,
+                "parse_status": "unsupported_type",
+                "parsed_text": "",
             }
+            entries.append((record, "", False))
+
+            if extension not in _manual_upload_exts:
+                continue
+
+            file_storage.stream.seek(0, os.SEEK_END)
+            record["size_bytes"] = int(file_storage.stream.tell() or 0)
+            file_storage.stream.seek(0)
+
+            if record["size_bytes"] > _manual_upload_max_size_bytes:
+                record["parse_status"] = "file_too_large"
+                continue
+
+            if extension in _manual_image_exts:
+                record["parsed_text"] = (
+                    f"Image attachment provided: {filename}. "
+                    "Use this image as input for visual/UI related test scenarios."
+                )
+                record["parse_status"] = "metadata_only"
+                continue
+
+            digest = f"{extension}:{_upload_digest(file_storage.stream)}"
+            # An identical upload under another name reuses the first parse and keeps its
+            # text out of the prompt a second time.
+            is_duplicate = digest in temp_paths_by_digest
+            if not is_duplicate:
+                temp_path = os.path.join(temp_dir, f"upload{len(temp_paths_by_digest)}{extension}")
+                try:
+                    file_storage.save(temp_path)
+                except Exception:
+                    record["parse_status"] = "parse_failed"
+                    continue
+                temp_paths_by_digest[digest] = (temp_path, extension)
+            entries[-1] = (record, digest, is_duplicate)
+
+        # Unique uploads are parsed concurrently; results come back in input order.
+        parsed_by_digest = dict(
+            zip(
+                temp_paths_by_digest,
+                document_parser.parse_files(list(temp_paths_by_digest.values())),
+            )
         )
-        if parsed_text:
-            parsed_chunks.append(parsed_text)
 
-    return parsed_chunks, attachment_records
+    for record, digest, is_duplicate in entries:
+        if digest:
+            record["parsed_text"] = parsed_by_digest.get(digest, "")
+            record["parse_status"] = "parsed" if record["parsed_text"] else "empty_or_unsupported"
+        if record["parsed_text"] and not is_duplicate:
+            parsed_chunks.append(record["parsed_text"])
+
+    return parsed_chunks, [record for record, _digest, _is_duplicate in entries]
 
 
 def _export_response_for_format(format_name, cases):
@@ -618,6 +645,32 @@ def _export_response_for_format(format_name, cases):
     return jsonify({"error": "Invalid format. Allowed: excel, csv, json, pdf, gherkin, plain"}), 400
 
 
+@app.after_request
+def compress_response(response):
+    # Test-case payloads and the SPA shell are repetitive text that gzip shrinks several times.
+    # Static assets and file downloads (direct passthrough) are sent as-is.
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code != 200
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in _gzip_mimetypes
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if "gzip" not in request.accept_encodings:
+        return response
+    data = response.get_data()
+    if len(data) < _gzip_min_size_bytes:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers["Content-Encoding"] = "gzip"
+    etag, _weak = response.get_etag()
+    if etag:
+        response.set_etag(etag, weak=True)
+    return response
+
+
 @app.errorhandler(Exception)
 def handle_exception(exc):
     if isinstance(exc, HTTPException):
@@ -635,8 +688,9 @@ def handle_exception(exc):
 
 @app.get("/")
 def serve_root():
-    if os.path.isdir(_frontend_dist):
-        return send_from_directory(_frontend_dist, "index.html")
+    response = _frontend_index_response()
+    if response is not None:
+        return response
     return jsonify({"error": "Frontend build not found"}), 404
 
 
@@ -656,6 +710,13 @@ def llm_models():
     ), 200
 
 
+@app.post("/llm-cache/clear")
+def clear_llm_cache():
+    removed = llm_engine.llm.clear_response_cache()
+    _log_activity(f"Cleared {removed} cached LLM response(s).", category="system")
+    return jsonify({"cleared": removed}), 200
+
+
 @app.get("/settings")
 def get_settings():
     return jsonify(_load_settings()), 200
@@ -690,7 +751,6 @@ def update_settings():
 
 @app.get("/attachment/file")
 def attachment_file():
-    _apply_runtime_settings(_load_settings())
     settings = _load_settings()
     jira_settings = settings.get("jira", {}) if isinstance(settings, dict) else {}
     if not bool(jira_settings.get("attachment_download_enabled", True)):
@@ -735,7 +795,6 @@ def attachment_file():
 
 @app.post("/generate-from-jira")
 def generate_from_jira():
-    _apply_runtime_settings(_load_settings())
     payload = _extract_payload()
     issue_key = str(payload.get("issue_key", "")).strip()
     model_id = str(payload.get("model_id", "")).strip() or "stepfun/step-3.5-flash:free"
@@ -786,6 +845,7 @@ def generate_from_jira():
         model_id=model_id,
         output_language=output_language,
         temperature_override=0.0 if stabilize else None,
+        use_cache=not _bypass_llm_cache(payload),
     )
     normalized = [_normalize_generated_case(case) for case in test_cases]
     test_cases = [case for case in normalized if case]
@@ -818,7 +878,6 @@ def generate_from_jira():
 
 @app.post("/preview-jira")
 def preview_jira():
-    _apply_runtime_settings(_load_settings())
     payload = request.get_json(silent=True) or {}
     issue_key = str(payload.get("issue_key", "")).strip()
 
@@ -837,7 +896,6 @@ def preview_jira():
 
 @app.post("/manual-generate-test")
 def manual_generate():
-    _apply_runtime_settings(_load_settings())
     payload = _extract_payload()
     description = str(payload.get("description", "")).strip()
     acceptance_criteria = str(payload.get("acceptance_criteria", "")).strip()
@@ -909,6 +967,7 @@ def manual_generate():
         model_id=model_id,
         output_language=output_language,
         temperature_override=0.0 if stabilize else None,
+        use_cache=not _bypass_llm_cache(payload),
     )
     normalized = [_normalize_generated_case(case) for case in test_cases]
     test_cases = [case for case in normalized if case]
@@ -941,7 +1000,6 @@ def manual_generate():
 
 @app.post("/generate-locators")
 def generate_locators():
-    _apply_runtime_settings(_load_settings())
     payload = _extract_payload()
     dom = str(payload.get("dom", "")).strip()
     framework = str(payload.get("framework", "")).strip()
@@ -980,6 +1038,7 @@ def generate_locators():
         language=("TypeScript" if language_key == "typescript" else language_key.title()),
         custom_prompt=custom_prompt,
         model_id=model_id,
+        use_cache=not _bypass_llm_cache(payload),
     )
     _log_activity("Generated locators from provided DOM.", category="locators")
     return jsonify(result), 200
@@ -988,7 +1047,7 @@ def generate_locators():
 @app.get("/testcases/latest")
 def latest_testcases():
     cases = _read_latest_cases(exportable_only=False)
-    return jsonify({"counts": _compute_counts(cases), "test_cases": cases}), 200
+    return _conditional_json({"counts": _compute_counts(cases), "test_cases": cases})
 
 
 @app.get("/review-queue")
@@ -999,7 +1058,7 @@ def review_queue():
         cases = [case for case in cases if str(case.get("review_status", "")).lower() == status]
     counts = _compute_counts(_read_latest_cases(exportable_only=False))
     counts["all"] = counts["total"]
-    return jsonify({"test_cases": cases, "counts": counts}), 200
+    return _conditional_json({"test_cases": cases, "counts": counts})
 
 
 @app.post("/review-queue/update")
@@ -1076,7 +1135,7 @@ def dashboard_metrics():
     with _activity_lock:
         recent_activity = list(_activity_log)
 
-    return jsonify(
+    return _conditional_json(
         {
             "counts": counts,
             "approval_rate": approval_rate,
@@ -1084,7 +1143,7 @@ def dashboard_metrics():
             "priority_breakdown": priority_breakdown,
             "recent_activity": recent_activity,
         }
-    ), 200
+    )
 
 
 @app.post("/export-testcases")
@@ -1179,7 +1238,6 @@ def review_testcases():
 
 @app.post("/testrail/push")
 def push_testrail():
-    _apply_runtime_settings(_load_settings())
     settings = _load_settings()
     behavior = settings.get("behavior", {}) if isinstance(settings, dict) else {}
     testrail_settings = settings.get("testrail", {}) if isinstance(settings, dict) else {}
@@ -1278,13 +1336,23 @@ def push_testrail():
 
 @app.get("/<path:asset_path>")
 def serve_frontend_assets(asset_path: str):
-    if not os.path.isdir(_frontend_dist):
-        return jsonify({"error": "Not found"}), 404
-
     requested = os.path.join(_frontend_dist, asset_path)
     if os.path.isfile(requested):
+        if asset_path.startswith("assets/"):
+            # Vite fingerprints every file under assets/, so new builds always use new URLs.
+            response = send_from_directory(
+                _frontend_dist,
+                asset_path,
+                max_age=_frontend_asset_max_age,
+            )
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+            return response
         return send_from_directory(_frontend_dist, asset_path)
-    return send_from_directory(_frontend_dist, "index.html")
+    response = _frontend_index_response()
+    if response is not None:
+        return response
+    return jsonify({"error": "Not found"}), 404
 
 
 _load_persisted_state()
@@ -19,6 +19,7 @@ class Config:
 
     CORS_ORIGINS: str = os.getenv("CORS_ORIGINS", "http://localhost:5173")
     EXPORT_DIR: str = os.getenv("EXPORT_DIR", "exports")
+    MAX_UPLOAD_REQUEST_BYTES: int = int(os.getenv("MAX_UPLOAD_REQUEST_BYTES", str(50 * 1024 * 1024)))
 
     LLM_MODEL_PATH: str = os.getenv("LLM_MODEL_PATH", "")
     LLM_N_CTX: int = int(os.getenv("LLM_N_CTX", "4096"))
@@ -26,6 +27,7 @@ class Config:
     LLM_TEMPERATURE: float = float(os.getenv("LLM_TEMPERATURE", "0.1"))
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "auto").lower()
     LLM_TIMEOUT_SECONDS: int = int(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
 
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
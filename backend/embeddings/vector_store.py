@@ -1,9 +1,6 @@
+from threading import Lock
 from typing import Dict, List, Optional
 
-import faiss
-import numpy as np
-from sentence_transformers import SentenceTransformer
-
 from config import Config
 
 
@@ -14,21 +11,36 @@ class EmbeddingVectorStore:
         self.index = None
         self.metadata: List[Dict] = []
         self.enabled = True
-        self._init_model()
+        self._model_loaded = False
+        self._model_lock = Lock()
 
     def _init_model(self):
-        try:
-            self.model = SentenceTransformer(self.model_name, local_files_only=True)
-        except Exception:
-            self.enabled = False
+        # faiss, numpy and sentence-transformers (torch) are slow to import and the model is
+        # slow to load, so both are deferred until the first add/search call.
+        with self._model_lock:
+            if self._model_loaded:
+                return
+            try:
+                import faiss  # noqa: F401
+                from sentence_transformers import SentenceTransformer
+
+                self.model = SentenceTransformer(self.model_name, local_files_only=True)
+            except Exception:
+                self.enabled = False
+            self._model_loaded = True
 
     def add_texts(self, texts: List[str], metadatas: Optional[List[Dict]] = None):
+        if not self._model_loaded:
+            self._init_model()
         if not self.enabled or self.model is None:
             return
         cleaned = [t.strip() for t in texts if t and t.strip()]
         if not cleaned:
             return
 
+        import faiss
+        import numpy as np
+
         embeddings = self.model.encode(cleaned, convert_to_numpy=True)
         embeddings = embeddings.astype(np.float32)
         faiss.normalize_L2(embeddings)
@@ -50,6 +62,10 @@ class EmbeddingVectorStore:
     def search(self, query: str, top_k: int = 3) -> List[Dict]:
         if not self.enabled or self.model is None or self.index is None or not query.strip():
             return []
+
+        import faiss
+        import numpy as np
+
         vector = self.model.encode([query], convert_to_numpy=True).astype(np.float32)
         faiss.normalize_L2(vector)
         distances, indices = self.index.search(vector, top_k)
@@ -0,0 +1,13 @@
+import os
+
+# Review queue, settings and the LLM response cache live in process memory, so the app runs as a
+# single worker process. Requests spend nearly all their time waiting on LLM and Jira I/O, which
+# threads overlap well; size GUNICORN_THREADS to the number of generations expected at once.
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = 1
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+# A generation can walk the provider fallback chain, each attempt bounded by LLM_TIMEOUT_SECONDS.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
+graceful_timeout = 30
+keepalive = 5
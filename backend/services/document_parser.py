@@ -1,53 +1,181 @@
+import csv
+import importlib.util
+import io
+import logging
+import mmap
 import os
-from typing import List
-
-import pandas as pd
-from PyPDF2 import PdfReader
-from docx import Document
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from services.multi_xml_loader import MultiXMLLoader
 
+# Parser backends (pandas, PyPDF2, python-docx, pypdfium2) are imported on first use so
+# importing this module stays cheap; only availability of the optional pdfium backend is probed.
+PDFIUM_AVAILABLE = importlib.util.find_spec("pypdfium2") is not None
+
+logger = logging.getLogger(__name__)
+
+# PDFium is not thread-safe; parse_files runs parsers on worker threads.
+_pdfium_lock = Lock()
+
 
 class DocumentParser:
-    def __init__(self):
+    # Text beyond this size cannot fit any supported model context, so it is never decoded.
+    MAX_TEXT_FILE_BYTES = 2 * 1024 * 1024
+    MAX_TABLE_ROWS = 1000
+
+    _PARSER_NAMES = {
+        ".pdf": "_parse_pdf",
+        ".docx": "_parse_docx",
+        ".xlsx": "_parse_excel",
+        ".xls": "_parse_legacy_excel",
+        ".csv": "_parse_csv",
+        ".xml": "_parse_xml",
+        ".txt": "_parse_text",
+        ".log": "_parse_text",
+        ".md": "_parse_text",
+        ".json": "_parse_text",
+        ".yaml": "_parse_text",
+        ".yml": "_parse_text",
+        ".html": "_parse_text",
+        ".htm": "_parse_text",
+        ".rtf": "_parse_text",
+    }
+    SUPPORTED_EXTENSIONS = frozenset(_PARSER_NAMES)
+
+    def __init__(self, max_workers: int = 4):
         self.xml_loader = MultiXMLLoader()
+        self.max_workers = max(1, int(max_workers or 1))
+        self._parsers: Dict[str, Callable[[str], str]] = {
+            extension: getattr(self, name) for extension, name in self._PARSER_NAMES.items()
+        }
 
-    def parse_file(self, file_path: str) -> str:
-        extension = os.path.splitext(file_path)[1].lower()
-        try:
-            if extension == ".pdf":
-                return self._parse_pdf(file_path)
-            if extension == ".docx":
-                return self._parse_docx(file_path)
-            if extension in [".xlsx", ".xls"]:
-                return self._parse_excel(file_path)
-            if extension == ".csv":
-                return self._parse_csv(file_path)
-            if extension == ".xml":
-                return self._parse_xml(file_path)
-            if extension in [".txt", ".log", ".md", ".json", ".yaml", ".yml", ".html", ".htm", ".rtf"]:
-                return self._parse_text(file_path)
+    def parse_file(self, file_path: str, extension: Optional[str] = None) -> str:
+        if extension is None:
+            extension = os.path.splitext(file_path)[1].lower()
+        parser = self._parsers.get(extension)
+        if parser is None:
             return ""
+        try:
+            return parser(file_path)
         except Exception:
             return ""
 
-    def parse_files(self, file_paths: List[str]) -> List[str]:
-        return [self.parse_file(path) for path in file_paths if path]
+    def parse_files(self, files: List[Tuple[str, Optional[str]]]) -> List[str]:
+        # Each entry is (path, extension); a None extension is taken from the path.
+        files = [(path, extension) for path, extension in files if path]
+        if len(files) <= 1 or self.max_workers == 1:
+            return [self.parse_file(path, extension) for path, extension in files]
+        # Parsing is dominated by disk I/O and C-extension work, so threads overlap well.
+        # parse_file never raises, and map() keeps results in input order.
+        paths, extensions = zip(*files)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(files))) as executor:
+            return list(executor.map(self.parse_file, paths, extensions))
 
     @staticmethod
     def _parse_pdf(file_path: str) -> str:
+        if PDFIUM_AVAILABLE:
+            try:
+                return DocumentParser._parse_pdf_pdfium(file_path)
+            except Exception:
+                logger.warning("pdfium failed to read %s, falling back to PyPDF2", file_path)
+        return DocumentParser._parse_pdf_pypdf2(file_path)
+
+    @staticmethod
+    def _parse_pdf_pdfium(file_path: str) -> str:
+        import pypdfium2 as pdfium
+
+        with _pdfium_lock:
+            document = pdfium.PdfDocument(file_path)
+
+            def extract_page(idx: int) -> str:
+                page = document[idx]
+                textpage = page.get_textpage()
+                try:
+                    # PDFium separates lines with CRLF; match the PyPDF2 path's plain newlines.
+                    text = textpage.get_text_range() or ""
+                    return text.replace("\r\n", "\n").replace("\r", "\n")
+                finally:
+                    textpage.close()
+                    page.close()
+
+            try:
+                return DocumentParser._extract_pdf_pages(file_path, len(document), extract_page, "pdfium")
+            finally:
+                document.close()
+
+    @staticmethod
+    def _parse_pdf_pypdf2(file_path: str) -> str:
+        from PyPDF2 import PdfReader
+
         reader = PdfReader(file_path)
-        pages = [page.extract_text() or "" for page in reader.pages]
+        return DocumentParser._extract_pdf_pages(
+            file_path,
+            len(reader.pages),
+            lambda idx: reader.pages[idx].extract_text() or "",
+            "PyPDF2",
+        )
+
+    @staticmethod
+    def _extract_pdf_pages(
+        file_path: str,
+        page_count: int,
+        extract_page: Callable[[int], str],
+        extractor: str,
+    ) -> str:
+        started = time.perf_counter()
+        pages = [extract_page(idx) for idx in range(page_count)]
+        logger.debug(
+            "Extracted %d PDF page(s) from %s with %s in %.3fs",
+            page_count,
+            file_path,
+            extractor,
+            time.perf_counter() - started,
+        )
         return "\n".join(pages).strip()
 
     @staticmethod
     def _parse_docx(file_path: str) -> str:
+        from docx import Document
+
         doc = Document(file_path)
         return "\n".join([p.text for p in doc.paragraphs if p.text]).strip()
 
     @staticmethod
     def _parse_excel(file_path: str) -> str:
-        sheets = pd.read_excel(file_path, sheet_name=None)
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            chunks = []
+            for sheet in workbook.worksheets:
+                # Read-only mode trusts the sheet's stored <dimension>, which some exporters write
+                # wrong (e.g. "A1"); reset it so every row is read, then pad the ragged rows.
+                sheet.reset_dimensions()
+                rows = (
+                    ["" if value is None else value for value in row]
+                    for row in sheet.iter_rows(values_only=True)
+                    if any(value is not None for value in row)
+                )
+                head = list(islice(rows, DocumentParser.MAX_TABLE_ROWS + 1))
+                width = max((len(row) for row in head), default=0)
+                padded = (row + [""] * (width - len(row)) for row in head)
+                chunks.append(f"Sheet: {sheet.title}")
+                chunks.append(
+                    DocumentParser._rows_to_csv(chain(padded, rows), source=f"{file_path}:{sheet.title}")
+                )
+            return "\n".join(chunks).strip()
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _parse_legacy_excel(file_path: str) -> str:
+        import pandas as pd
+
+        sheets = pd.read_excel(file_path, sheet_name=None, nrows=DocumentParser.MAX_TABLE_ROWS)
         chunks = []
         for sheet_name, frame in sheets.items():
             chunks.append(f"Sheet: {sheet_name}")
@@ -56,13 +184,45 @@ class DocumentParser:
 
     @staticmethod
     def _parse_csv(file_path: str) -> str:
-        frame = pd.read_csv(file_path)
-        return frame.fillna("").to_csv(index=False).strip()
+        # utf-8-sig drops the BOM that Excel's "CSV UTF-8" export writes.
+        try:
+            with open(file_path, "r", encoding="utf-8-sig", errors="ignore", newline="") as fp:
+                rows = (row for row in csv.reader(fp) if row)
+                return DocumentParser._rows_to_csv(rows, source=file_path).strip()
+        except csv.Error:
+            # e.g. a field over the csv module's size limit; keep the content as plain text.
+            logger.info("Falling back to plain text for unparseable CSV %s", file_path)
+            return DocumentParser._parse_text(file_path)
+
+    @staticmethod
+    def _rows_to_csv(rows: Iterable[Sequence], source: str) -> str:
+        # Header plus up to MAX_TABLE_ROWS data rows.
+        limit = DocumentParser.MAX_TABLE_ROWS + 1
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        rows = iter(rows)
+        writer.writerows(islice(rows, limit))
+        if next(rows, None) is not None:
+            logger.info("Truncated %s to %d data rows", source, DocumentParser.MAX_TABLE_ROWS)
+        return buffer.getvalue()
 
     def _parse_xml(self, file_path: str) -> str:
         return self.xml_loader.load_files([file_path])
 
     @staticmethod
     def _parse_text(file_path: str) -> str:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as fp:
-            return fp.read().strip()
+        limit = DocumentParser.MAX_TEXT_FILE_BYTES
+        with open(file_path, "rb") as fp:
+            try:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if len(mapped) > limit:
+                        logger.info("Truncating %s from %d to %d bytes", file_path, len(mapped), limit)
+                    raw = mapped[:limit]
+            except ValueError:
+                # Empty files cannot be mapped.
+                return ""
+            except OSError:
+                raw = fp.read(limit)
+        text = raw.decode("utf-8", errors="ignore")
+        # Match the universal-newline handling of text-mode reads.
+        return text.replace("\r\n", "\n").replace("\r", "\n").strip()
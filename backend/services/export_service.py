@@ -1,16 +1,19 @@
 import io
 import os
 import html
-import json
 import re
 from datetime import datetime
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-import pandas as pd
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import HRFlowable, Paragraph, SimpleDocTemplate, Spacer
+import orjson
+
+# pandas and reportlab are imported inside the export methods that need them so that
+# app startup does not pay for them until the first export.
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Leading explicit numbering like "1.", "2)", "3 -", "4:".
+_STEP_NUMBER_RE = re.compile(r"^\s*\d+\s*[\.\)\-:]\s+")
 
 
 class ExportService:
@@ -23,11 +26,12 @@ class ExportService:
         text = str(step or "").strip()
         if not text:
             return ""
-        # Remove leading explicit numbering like "1.", "2)", "3 -", "4:".
-        return re.sub(r"^\s*\d+\s*[\.\)\-:]\s+", "", text)
+        return _STEP_NUMBER_RE.sub("", text, count=1)
 
     @staticmethod
-    def _to_dataframe(test_cases: List[Dict]) -> pd.DataFrame:
+    def _to_dataframe(test_cases: List[Dict]) -> "pd.DataFrame":
+        import pandas as pd
+
         records = []
         for case in test_cases:
             raw_steps = case.get("steps", []) or []
@@ -46,6 +50,8 @@ class ExportService:
         return pd.DataFrame(records)
 
     def export_excel_bytes(self, test_cases: List[Dict]) -> bytes:
+        import pandas as pd
+
         df = self._to_dataframe(test_cases)
         buffer = io.BytesIO()
         with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
@@ -58,9 +64,14 @@ class ExportService:
 
     @staticmethod
     def export_json_bytes(test_cases: List[Dict]) -> bytes:
-        return json.dumps({"test_cases": test_cases}, ensure_ascii=False, indent=2).encode("utf-8")
+        return orjson.dumps({"test_cases": test_cases}, option=orjson.OPT_INDENT_2)
 
     def export_pdf_bytes(self, test_cases: List[Dict]) -> bytes:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.platypus import HRFlowable, Paragraph, SimpleDocTemplate, Spacer
+
         def _safe(value) -> str:
             text = str(value or "-")
             return html.escape(text).replace("\n", "<br/>")
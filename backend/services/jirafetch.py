@@ -2,16 +2,22 @@ import os
 import re
 import tempfile
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
-import requests
-
 from config import Config
 from services.document_parser import DocumentParser
+from utils.http_session import create_pooled_session
+
+_ISSUE_KEY_RE = re.compile(r"^([A-Z][A-Z0-9]+)-(\d+)$")
+_ISSUE_NUMBER_RE = re.compile(r"^(\d+)$")
 
 
 class JiraFetchService:
     MAX_INLINE_PREVIEW_BYTES = 1_500_000
+    MAX_ATTACHMENT_WORKERS = 4
+    MAX_ISSUE_WORKERS = 4
+    DOWNLOAD_CHUNK_BYTES = 1024 * 1024
 
     def __init__(self):
         self.base_url = Config.JIRA_BASE_URL
@@ -20,6 +26,9 @@ class JiraFetchService:
         self.attachment_download_enabled = True
         self.attachment_parse_enabled = True
         self.parser = DocumentParser()
+        self.session = create_pooled_session(
+            pool_maxsize=self.MAX_ISSUE_WORKERS * self.MAX_ATTACHMENT_WORKERS
+        )
 
     def update_settings(
         self,
@@ -39,7 +48,12 @@ class JiraFetchService:
         issue_keys = self._parse_issue_keys(issue_key)
         self._validate_credentials()
 
-        issues_data = [self._fetch_single_issue_details(key) for key in issue_keys]
+        if len(issue_keys) == 1:
+            issues_data = [self._fetch_single_issue_details(issue_keys[0])]
+        else:
+            # Combined keys are independent REST round-trips; overlap their network latency.
+            with ThreadPoolExecutor(max_workers=min(self.MAX_ISSUE_WORKERS, len(issue_keys))) as executor:
+                issues_data = list(executor.map(self._fetch_single_issue_details, issue_keys))
 
         if len(issues_data) == 1:
             return issues_data[0]
@@ -89,18 +103,18 @@ class JiraFetchService:
         if not parts:
             raise ValueError("Invalid issue_key format. Expected format like PROJ-123.")
 
-        match_first = re.match(r"^([A-Z][A-Z0-9]+)-(\d+)$", parts[0])
+        match_first = _ISSUE_KEY_RE.match(parts[0])
         if not match_first:
             raise ValueError("Invalid issue_key format. Expected format like PROJ-123.")
 
         project = match_first.group(1)
         normalized = [f"{project}-{match_first.group(2)}"]
         for part in parts[1:]:
-            full_match = re.match(r"^([A-Z][A-Z0-9]+)-(\d+)$", part)
+            full_match = _ISSUE_KEY_RE.match(part)
             if full_match:
                 normalized.append(f"{full_match.group(1)}-{full_match.group(2)}")
                 continue
-            short_match = re.match(r"^(\d+)$", part)
+            short_match = _ISSUE_NUMBER_RE.match(part)
             if short_match:
                 normalized.append(f"{project}-{short_match.group(1)}")
                 continue
@@ -114,7 +128,7 @@ class JiraFetchService:
     def _fetch_single_issue_details(self, issue_key: str) -> Dict[str, Any]:
         url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
         params = {"expand": "renderedFields"}
-        response = requests.get(url, params=params, auth=(self.username, self.api_token), timeout=30)
+        response = self.session.get(url, params=params, auth=(self.username, self.api_token), timeout=30)
 
         if response.status_code == 401:
             raise ValueError("Jira authentication failed (401). Check JIRA_USERNAME and JIRA_API_TOKEN.")
@@ -242,68 +256,86 @@ class JiraFetchService:
         if not attachments:
             return []
 
-        parsed_attachments = []
-        for item in attachments:
-            content_url = item.get("content")
-            filename = item.get("filename", "attachment")
-            attachment_record = {
-                "source_issue_key": issue_key,
-                "filename": filename,
-                "mime_type": item.get("mimeType", ""),
-                "size_bytes": item.get("size", 0),
-                "content_url": content_url or "",
-                "download_status": "skipped",
-                "parse_status": "not_parsed",
-                "parsed_text": "",
-                "preview_data_url": "",
-            }
-            if not content_url:
-                parsed_attachments.append(attachment_record)
-                continue
-            if not self.attachment_download_enabled:
-                attachment_record["download_status"] = "download_disabled"
-                parsed_attachments.append(attachment_record)
-                continue
-            try:
-                response = requests.get(
-                    content_url,
-                    auth=(self.username, self.api_token),
-                    timeout=30,
+        if len(attachments) == 1:
+            return [self._download_and_parse_attachment(attachments[0], issue_key)]
+
+        # Each attachment is an independent HTTP download + parse, so overlap them.
+        workers = min(self.MAX_ATTACHMENT_WORKERS, len(attachments))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda item: self._download_and_parse_attachment(item, issue_key),
+                    attachments,
                 )
+            )
+
+    def _download_and_parse_attachment(self, item: Dict[str, Any], issue_key: str) -> Dict[str, Any]:
+        content_url = item.get("content")
+        filename = item.get("filename", "attachment")
+        attachment_record = {
+            "source_issue_key": issue_key,
+            "filename": filename,
+            "mime_type": item.get("mimeType", ""),
+            "size_bytes": item.get("size", 0),
+            "content_url": content_url or "",
+            "download_status": "skipped",
+            "parse_status": "not_parsed",
+            "parsed_text": "",
+            "preview_data_url": "",
+        }
+        if not content_url:
+            return attachment_record
+        if not self.attachment_download_enabled:
+            attachment_record["download_status"] = "download_disabled"
+            return attachment_record
+        extension = os.path.splitext(filename)[1]
+        try:
+            # Stream the body so parseable attachments go to disk in chunks instead of being
+            # held in memory whole, and skipped attachments are never read at all.
+            with self.session.get(
+                content_url,
+                auth=(self.username, self.api_token),
+                timeout=30,
+                stream=True,
+            ) as response:
                 if response.status_code >= 400:
                     attachment_record["download_status"] = f"http_{response.status_code}"
-                    parsed_attachments.append(attachment_record)
-                    continue
-                with tempfile.NamedTemporaryFile(
-                    mode="wb",
-                    delete=False,
-                    suffix=os.path.splitext(filename)[1] or ".tmp",
-                ) as tmp:
-                    tmp.write(response.content)
-                    attachment_record["download_status"] = "downloaded"
-
-                    mime_type = str(attachment_record.get("mime_type", "")).lower()
-                    if (
-                        mime_type.startswith("image/")
-                        and len(response.content) <= self.MAX_INLINE_PREVIEW_BYTES
-                    ):
-                        encoded = base64.b64encode(response.content).decode("ascii")
+                    return attachment_record
+                attachment_record["download_status"] = "downloaded"
+
+                mime_type = str(attachment_record.get("mime_type", "")).lower()
+                # Jira reports the size up front, so images too large to preview are never read.
+                if (
+                    mime_type.startswith("image/")
+                    and int(attachment_record.get("size_bytes") or 0) <= self.MAX_INLINE_PREVIEW_BYTES
+                ):
+                    content = response.content
+                    if len(content) <= self.MAX_INLINE_PREVIEW_BYTES:
+                        encoded = base64.b64encode(content).decode("ascii")
                         attachment_record["preview_data_url"] = f"data:{mime_type};base64,{encoded}"
-
-                    if self.attachment_parse_enabled:
-                        parsed_text = self.parser.parse_file(tmp.name)
-                        if parsed_text:
-                            attachment_record["parse_status"] = "parsed"
-                            attachment_record["parsed_text"] = parsed_text
-                        else:
-                            attachment_record["parse_status"] = "empty_or_unsupported"
-                    else:
-                        attachment_record["parse_status"] = "parse_disabled"
-                    parsed_attachments.append(attachment_record)
-            except Exception:
-                attachment_record["download_status"] = "download_failed"
-                attachment_record["parse_status"] = "parse_failed"
-                parsed_attachments.append(attachment_record)
-                continue
-
-        return parsed_attachments
+                    del content
+
+                if not self.attachment_parse_enabled:
+                    attachment_record["parse_status"] = "parse_disabled"
+                    return attachment_record
+                if extension.lower() not in self.parser.SUPPORTED_EXTENSIONS:
+                    # Images and other binary types have no parser; skip the temp-file round-trip.
+                    attachment_record["parse_status"] = "empty_or_unsupported"
+                    return attachment_record
+
+                with tempfile.TemporaryDirectory(prefix="phoenix_") as temp_dir:
+                    temp_path = os.path.join(temp_dir, f"attachment{extension}")
+                    with open(temp_path, "wb") as tmp:
+                        for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_BYTES):
+                            tmp.write(chunk)
+                    parsed_text = self.parser.parse_file(temp_path, extension=extension.lower())
+            if parsed_text:
+                attachment_record["parse_status"] = "parsed"
+                attachment_record["parsed_text"] = parsed_text
+            else:
+                attachment_record["parse_status"] = "empty_or_unsupported"
+            return attachment_record
+        except Exception:
+            attachment_record["download_status"] = "download_failed"
+            attachment_record["parse_status"] = "parse_failed"
+            return attachment_record
@@ -1,14 +1,22 @@
+import hashlib
 import json
 import logging
 import re
-from typing import Dict, List, Optional
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock, local
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
 from config import Config
 from utils.dom_locator_parser import extract_locators
+from utils.http_session import create_pooled_session
+from utils.json_store import load_json, save_json
 
 logger = logging.getLogger(__name__)
+_http_session = create_pooled_session()
 
 OPENROUTER_TEST_CASE_MODEL = "stepfun/step-3.5-flash:free"
 OPENROUTER_LOCATOR_MODEL = "qwen/qwen3-coder:free"
@@ -69,7 +77,7 @@ def call_openrouter(
     }
 
     try:
-        response = requests.post(
+        response = _http_session.post(
             url,
             headers=headers,
             json=payload,
@@ -119,8 +127,13 @@ def call_openrouter(
     return ""
 
 
+_DEFAULT_RESPONSE_CACHE_FILE = Path(__file__).resolve().parent.parent / "storage" / "llm_response_cache.json"
+
+
 class LLMService:
-    def __init__(self):
+    RESPONSE_CACHE_MAX_ENTRIES = 128
+
+    def __init__(self, cache_file: Optional[str] = None):
         self.provider = Config.LLM_PROVIDER
         self.max_tokens = Config.LLM_MAX_TOKENS
         self.temperature = Config.LLM_TEMPERATURE
@@ -140,7 +153,28 @@ class LLMService:
         self.openrouter_base_url = Config.OPENROUTER_BASE_URL
 
         self.default_model_id = Config.LLM_DEFAULT_MODEL_ID
-        self.last_model_used = ""
+        # One service instance serves concurrent requests on server worker threads, so
+        # per-call state (model used, temperature override) is kept thread-local.
+        self._call_state = local()
+
+        self.cache_ttl_seconds = Config.LLM_CACHE_TTL_SECONDS
+        self._response_cache_file = Path(cache_file) if cache_file else _DEFAULT_RESPONSE_CACHE_FILE
+        self._response_cache: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._response_cache_loaded = False
+        self._response_cache_lock = Lock()
+
+    @property
+    def last_model_used(self) -> str:
+        return getattr(self._call_state, "last_model_used", "")
+
+    @last_model_used.setter
+    def last_model_used(self, value: str) -> None:
+        self._call_state.last_model_used = value
+
+    @property
+    def _call_temperature(self) -> float:
+        override = getattr(self._call_state, "temperature", None)
+        return self.temperature if override is None else override
 
     @staticmethod
     def _dedupe(values: List[str]) -> List[str]:
@@ -185,7 +219,7 @@ class LLMService:
                 prompt,
                 api_key=self.openrouter_api_key,
                 base_url=self.openrouter_base_url,
-                temperature=self.temperature,
+                temperature=self._call_temperature,
                 max_tokens=self.max_tokens,
                 timeout_seconds=self.timeout_seconds,
             )
@@ -258,7 +292,110 @@ class LLMService:
             )
         return models
 
-    def generate_json(self, prompt: str, seed_payload: Dict, model_id: Optional[str] = None) -> str:
+    def generate_json(
+        self,
+        prompt: str,
+        seed_payload: Dict,
+        model_id: Optional[str] = None,
+        temperature: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> str:
+        self.last_model_used = ""
+        self._call_state.temperature = temperature
+        self._call_state.pending_cache_entry = None
+        try:
+            cache_key = self._response_cache_key(prompt, model_id) if self.cache_enabled else ""
+            if cache_key and use_cache:
+                cached = self._read_cached_response(cache_key)
+                if cached:
+                    self.last_model_used, result = cached
+                    return result
+
+            result = self._generate_json_uncached(prompt, seed_payload, model_id=model_id)
+            # Fresh responses are only cached once the caller has validated them (see
+            # cache_last_response), so an unusable answer is retried instead of replayed.
+            if cache_key and result:
+                self._call_state.pending_cache_entry = (cache_key, self.last_model_used, result)
+            return result
+        finally:
+            self._call_state.temperature = None
+
+    def cache_last_response(self) -> None:
+        entry = getattr(self._call_state, "pending_cache_entry", None)
+        self._call_state.pending_cache_entry = None
+        if entry is not None:
+            self._store_cached_response(*entry)
+
+    def clear_response_cache(self) -> int:
+        with self._response_cache_lock:
+            self._load_response_cache()
+            removed = len(self._response_cache)
+            self._response_cache.clear()
+            self._persist_response_cache()
+            return removed
+
+    def _response_cache_key(self, prompt: str, model_id: Optional[str]) -> str:
+        selected_model_id = (model_id or self.default_model_id or "").strip()
+        fingerprint = "|".join(
+            [
+                self.provider,
+                selected_model_id,
+                str(self._call_temperature),
+                str(self.max_tokens),
+                prompt,
+            ]
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def _read_cached_response(self, key: str) -> Optional[Tuple[str, str]]:
+        with self._response_cache_lock:
+            self._load_response_cache()
+            cached = self._response_cache.get(key)
+            if cached is None:
+                return None
+            model_used, response, stored_at = cached
+            if self._is_cache_entry_expired(stored_at):
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            logger.info("LLM response cache hit (%s)", model_used)
+            return model_used, response
+
+    def _store_cached_response(self, key: str, model_used: str, response: str) -> None:
+        with self._response_cache_lock:
+            self._load_response_cache()
+            self._response_cache[key] = (model_used, response, time.time())
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.RESPONSE_CACHE_MAX_ENTRIES:
+                self._response_cache.popitem(last=False)
+            self._persist_response_cache()
+
+    def _is_cache_entry_expired(self, stored_at: float) -> bool:
+        return self.cache_ttl_seconds > 0 and time.time() - stored_at > self.cache_ttl_seconds
+
+    def _load_response_cache(self) -> None:
+        # Caller holds _response_cache_lock.
+        if self._response_cache_loaded:
+            return
+        self._response_cache_loaded = True
+        entries = load_json(self._response_cache_file, [])
+        if not isinstance(entries, list):
+            return
+        for entry in entries[-self.RESPONSE_CACHE_MAX_ENTRIES:]:
+            try:
+                key, model_used, response, stored_at = entry
+                cached = (str(model_used), str(response), float(stored_at))
+            except (TypeError, ValueError):
+                continue
+            if not self._is_cache_entry_expired(cached[2]):
+                self._response_cache[str(key)] = cached
+
+    def _persist_response_cache(self) -> None:
+        # Caller holds _response_cache_lock. Entries are written oldest-first to keep LRU order.
+        entries = [[key, *value] for key, value in self._response_cache.items()]
+        save_json(self._response_cache_file, entries, indent=False)
+
+    def _generate_json_uncached(self, prompt: str, seed_payload: Dict, model_id: Optional[str] = None) -> str:
         if self.provider not in {"auto", "gemini", "openai", "anthropic", "openrouter"}:
             raise ValueError(
                 "Invalid LLM_PROVIDER. Allowed values: auto, gemini, openai, anthropic, openrouter."
@@ -401,7 +538,7 @@ class LLMService:
         url = f"{self.gemini_base_url}/models/{resolved_model}:generateContent"
         payload = {
             "generationConfig": {
-                "temperature": self.temperature,
+                "temperature": self._call_temperature,
                 "responseMimeType": "application/json",
             },
             "contents": [
@@ -412,7 +549,7 @@ class LLMService:
             ],
         }
         try:
-            response = requests.post(
+            response = _http_session.post(
                 url,
                 params={"key": self.gemini_api_key},
                 json=payload,
@@ -439,7 +576,7 @@ class LLMService:
         url = f"{self.openai_base_url}/chat/completions"
         payload = {
             "model": resolved_model,
-            "temperature": self.temperature,
+            "temperature": self._call_temperature,
             "max_tokens": self.max_tokens,
             "response_format": {"type": "json_object"},
             "messages": [
@@ -455,7 +592,7 @@ class LLMService:
         }
 
         try:
-            response = requests.post(
+            response = _http_session.post(
                 url,
                 headers=headers,
                 json=payload,
@@ -485,7 +622,7 @@ class LLMService:
         payload = {
             "model": resolved_model,
             "max_tokens": self.max_tokens,
-            "temperature": self.temperature,
+            "temperature": self._call_temperature,
             "messages": [
                 {
                     "role": "user",
@@ -500,7 +637,7 @@ class LLMService:
         }
 
         try:
-            response = requests.post(
+            response = _http_session.post(
                 url,
                 headers=headers,
                 json=payload,
@@ -29,6 +29,7 @@ class LLMEngine:
         model_id: Optional[str] = None,
         output_language: str = "",
         temperature_override: Optional[float] = None,
+        use_cache: bool = True,
     ) -> List[Dict]:
         searchable_chunks = []
         summary = issue_data.get("summary", "")
@@ -84,21 +85,25 @@ class LLMEngine:
             "source": "\n".join(searchable_chunks),
             "test_types": test_types,
         }
-        original_temperature = self.llm.temperature
+        temperature = None
         if temperature_override is not None:
             try:
-                self.llm.temperature = float(temperature_override)
+                temperature = float(temperature_override)
             except (TypeError, ValueError):
-                self.llm.temperature = original_temperature
-        try:
-            raw_response = self.llm.generate_json(prompt, seed_payload, model_id=model_id)
-        finally:
-            self.llm.temperature = original_temperature
+                temperature = None
+        raw_response = self.llm.generate_json(
+            prompt,
+            seed_payload,
+            model_id=model_id,
+            temperature=temperature,
+            use_cache=use_cache,
+        )
         self._ensure_strict_model_used()
         cases = parse_test_case_response(raw_response)
         cases = filter_test_cases(cases)
         if not cases:
             raise ValueError("LLM returned no valid test cases.")
+        self.llm.cache_last_response()
 
         final_cases = []
         for idx, case in enumerate(cases, start=1):
@@ -114,6 +119,7 @@ class LLMEngine:
         language: str,
         custom_prompt: str = "",
         model_id: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Dict:
         deterministic_locators = extract_locators(dom)
         prompt = build_locator_prompt(
@@ -132,7 +138,12 @@ class LLMEngine:
             "custom_prompt": custom_prompt,
         }
         try:
-            raw_response = self.llm.generate_json(prompt, seed_payload, model_id=model_id)
+            raw_response = self.llm.generate_json(
+                prompt,
+                seed_payload,
+                model_id=model_id,
+                use_cache=use_cache,
+            )
             parsed = parse_locator_response(raw_response)
             automation_script = parsed.get("automation_script", "")
             test_function = parsed.get("test_function", "") or automation_script
@@ -146,6 +157,7 @@ class LLMEngine:
             filtered_locators = filter_locators(merged_locators)
             if not filtered_locators:
                 raise ValueError("LLM returned no valid locators.")
+            self.llm.cache_last_response()
             return {
                 "locators": filtered_locators,
                 "test_function": test_function,
@@ -1,29 +1,55 @@
 import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
 
 class XMLParser:
     def parse_xml_string(self, xml_content: str) -> str:
-        root = ET.fromstring(xml_content)
-        lines = []
-        self._walk(root, path=root.tag, out=lines)
-        return "\n".join(lines).strip()
+        parser = ET.XMLPullParser(events=("start", "end"))
+        parser.feed(xml_content)
+        parser.close()
+        return self._walk_events(parser.read_events())
 
     def parse_xml_file(self, file_path: str) -> str:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        lines = []
-        self._walk(root, path=root.tag, out=lines)
-        return "\n".join(lines).strip()
-
-    def _walk(self, node, path, out):
-        text = (node.text or "").strip()
-        if text:
-            out.append(f"{path}: {text}")
-
-        for key, value in node.attrib.items():
-            out.append(f"{path}.@{key}: {value}")
+        # iterparse keeps memory bounded on large documents: elements are cleared once emitted.
+        if LET is not None:
+            # Attachments are untrusted input: expand internal entities only, never external (XXE).
+            events = LET.iterparse(
+                file_path,
+                events=("start", "end"),
+                huge_tree=True,
+                recover=True,
+                resolve_entities="internal",
+                no_network=True,
+            )
+        else:
+            events = ET.iterparse(file_path, events=("start", "end"))
+        return self._walk_events(events)
 
-        for child in list(node):
-            child_path = f"{path}.{child.tag}"
-            self._walk(child, child_path, out)
+    @staticmethod
+    def _walk_events(events) -> str:
+        out = []
+        paths = []
+        text_slots = []
+        for event, node in events:
+            if event == "start":
+                path = f"{paths[-1]}.{node.tag}" if paths else node.tag
+                paths.append(path)
+                # Element text is only complete at the end event, but it is reported before
+                # attributes and children, so reserve its slot now.
+                text_slots.append(len(out))
+                out.append(None)
+                for key, value in node.attrib.items():
+                    out.append(f"{path}.@{key}: {value}")
+                continue
 
+            path = paths.pop()
+            slot = text_slots.pop()
+            text = (node.text or "").strip()
+            if text:
+                out[slot] = f"{path}: {text}"
+            node.clear()
+        return "\n".join(line for line in out if line is not None).strip()
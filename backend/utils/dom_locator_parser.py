@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from html.parser import HTMLParser
 import re
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 _TESTID_KEYS = ("data-testid", "data-test-id", "data-qa", "data-cy")
@@ -16,12 +16,16 @@ class _Node:
     tag: str
     attrs: Dict[str, str]
     parent: Optional["_Node"] = None
-    text: str = ""
+    text_parts: List[str] = field(default_factory=list)
     children: List["_Node"] = field(default_factory=list)
 
+    @property
+    def text(self) -> str:
+        return "".join(self.text_parts)
+
     def add_text(self, value: str) -> None:
         if value:
-            self.text += value
+            self.text_parts.append(value)
 
 
 class _DOMParser(HTMLParser):
@@ -107,10 +111,15 @@ def _extract_label_text(nodes: Iterable[_Node]) -> Tuple[Dict[str, str], Dict[in
 
 
 def _collect_text(node: _Node) -> str:
-    parts = [node.text]
-    for child in node.children:
-        parts.append(_collect_text(child))
-    return "".join(parts)
+    return "".join(_iter_text_parts(node))
+
+
+def _iter_text_parts(node: _Node) -> Iterator[str]:
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield from current.text_parts
+        stack.extend(reversed(current.children))
 
 
 def _normalize_text(value: str) -> str:
@@ -0,0 +1,15 @@
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_pooled_session(pool_maxsize: int = 16) -> requests.Session:
+    # A shared Session keeps TCP/TLS connections to each host alive between calls. Cookies are
+    # blocked so nothing leaks between requests made with different credentials.
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
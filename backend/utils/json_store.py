@@ -0,0 +1,29 @@
+import logging
+import os
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+def load_json(path, fallback):
+    try:
+        with open(path, "rb") as handle:
+            return orjson.loads(handle.read())
+    except FileNotFoundError:
+        return fallback
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable JSON file: %s", path)
+        return fallback
+
+
+def save_json(path, payload, indent: bool = True) -> None:
+    # Written to a sibling temp file and swapped in, so readers never see a partial file.
+    temp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(os.fspath(path)) or ".", exist_ok=True)
+        with open(temp_path, "wb") as handle:
+            handle.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0))
+        os.replace(temp_path, path)
+    except OSError:
+        logger.warning("Failed to persist data to %s", path)
@@ -1,7 +1,11 @@
-import json
 import re
 from typing import Dict, List
 
+import orjson
+
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_STEP_SEPARATOR_RE = re.compile(r"[\n;]+")
+
 
 def parse_test_case_response(raw_text: str) -> List[Dict]:
     if not raw_text:
@@ -61,20 +65,20 @@ def parse_locator_response(raw_text: str) -> Dict:
 
 def _safe_json_load(value: str):
     try:
-        return json.loads(value)
+        return orjson.loads(value)
     except Exception:
         return None
 
 
 def _extract_json_fragment(text: str):
-    match = re.search(r"\{.*\}", text, re.DOTALL)
+    match = _JSON_OBJECT_RE.search(text)
     return match.group(0) if match else None
 
 
 def _normalize_case(case: Dict) -> Dict:
     steps = case.get("steps", [])
     if isinstance(steps, str):
-        steps = [s.strip() for s in re.split(r"[\n;]+", steps) if s.strip()]
+        steps = [s.strip() for s in _STEP_SEPARATOR_RE.split(steps) if s.strip()]
     if not isinstance(steps, list):
         steps = []
 
@@ -370,7 +370,7 @@ function Settings() {
               <div className="settings-fields">
                 <div className="settings-toggle-card">
                   <div>
-                    <div className="toggle-label">Redis cache enabled</div>
+                    <div className="toggle-label">LLM response cache enabled</div>
                     <div className="toggle-sub">Skip LLM call on cache hit (&lt;100ms)</div>
                   </div>
                   <button